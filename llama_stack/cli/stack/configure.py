@@ -45,21 +45,19 @@ class StackConfigure(Subcommand):
         from pathlib import Path
 
         import pkg_resources
-
-        import yaml
         from termcolor import cprint
 
         from llama_stack.distribution.build import ImageType
         from llama_stack.distribution.utils.exec import run_with_pty
+        from llama_stack.distribution.utils.serialize import load_config_cached
 
         docker_image = None
 
         build_config_file = Path(args.config)
 
         if build_config_file.exists():
-            with open(build_config_file, "r") as f:
-                build_config = BuildConfig(**yaml.safe_load(f))
-                self._configure_llama_distribution(build_config, args.output_dir)
+            build_config = BuildConfig(**load_config_cached(build_config_file))
+            self._configure_llama_distribution(build_config, args.output_dir)
             return
 
         # if we get here, we need to try to find the conda build config file
@@ -82,9 +80,7 @@ class StackConfigure(Subcommand):
         build_config_file = Path(conda_dir) / f"{args.config}-build.yaml"
 
         if build_config_file.exists():
-            with open(build_config_file, "r") as f:
-                build_config = BuildConfig(**yaml.safe_load(f))
-
+            build_config = BuildConfig(**load_config_cached(build_config_file))
             self._configure_llama_distribution(build_config, args.output_dir)
             return
 
@@ -120,7 +116,6 @@ class StackConfigure(Subcommand):
         build_config: BuildConfig,
         output_dir: Optional[str] = None,
     ):
-        import json
         import os
         from pathlib import Path
 
@@ -131,7 +126,10 @@ class StackConfigure(Subcommand):
             configure_api_providers,
             parse_and_maybe_upgrade_config,
         )
-        from llama_stack.distribution.utils.serialize import EnumEncoder
+        from llama_stack.distribution.utils.serialize import (
+            EnumDumper,
+            load_config_cached,
+        )
 
         builds_dir = BUILDS_BASE_DIR / build_config.image_type
         if output_dir:
@@ -146,7 +144,7 @@ class StackConfigure(Subcommand):
                 "yellow",
                 attrs=["bold"],
             )
-            config_dict = yaml.safe_load(run_config_file.read_text())
+            config_dict = load_config_cached(run_config_file)
             config = parse_and_maybe_upgrade_config(config_dict)
         else:
             config = StackRunConfig(
@@ -164,8 +162,7 @@ class StackConfigure(Subcommand):
         config.conda_env = image_name if build_config.image_type == "conda" else None
 
         with open(run_config_file, "w") as f:
-            to_write = json.loads(json.dumps(config.dict(), cls=EnumEncoder))
-            f.write(yaml.dump(to_write, sort_keys=False))
+            f.write(yaml.dump(config.dict(), Dumper=EnumDumper, sort_keys=False))
 
         cprint(
             f"> YAML configuration has been written to `{run_config_file}`.",
@@ -51,6 +51,7 @@ class StackRun(Subcommand):
         from llama_stack.distribution.configure import parse_and_maybe_upgrade_config
         from llama_stack.distribution.utils.config_dirs import BUILDS_BASE_DIR
         from llama_stack.distribution.utils.exec import run_with_pty
+        from llama_stack.distribution.utils.serialize import SafeLoader
 
         if not args.config:
             self.parser.error("Must specify a config file to run")
@@ -76,8 +77,8 @@ class StackRun(Subcommand):
             return
 
         cprint(f"Using config `{config_file}`", "green")
-        with open(config_file, "r") as f:
-            config_dict = yaml.safe_load(config_file.read_text())
+        with open(config_file, "rb") as f:
+            config_dict = yaml.load(f, Loader=SafeLoader)
             config = parse_and_maybe_upgrade_config(config_dict)
 
         if config.docker_image:
@@ -6,7 +6,7 @@
 import importlib
 import inspect
 
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List
 
 from llama_stack.providers.datatypes import *  # noqa: F403
 from llama_stack.distribution.datatypes import *  # noqa: F403
@@ -196,27 +196,31 @@ async def resolve_impls_with_routing(run_config: StackRunConfig) -> Dict[Api, An
 def topological_sort(
     providers_with_specs: Dict[str, List[ProviderWithSpec]],
 ) -> List[ProviderWithSpec]:
-    def dfs(kv, visited: Set[str], stack: List[str]):
-        api_str, providers = kv
-        visited.add(api_str)
-
-        deps = []
-        for provider in providers:
-            for dep in provider.spec.deps__:
-                deps.append(dep)
-
-        for dep in deps:
-            if dep not in visited:
-                dfs((dep, providers_with_specs[dep]), visited, stack)
-
-        stack.append(api_str)
+    deps_by_api = {
+        api_str: tuple(dep for provider in providers for dep in provider.spec.deps__)
+        for api_str, providers in providers_with_specs.items()
+    }
 
     visited = set()
     stack = []
 
-    for api_str, providers in providers_with_specs.items():
-        if api_str not in visited:
-            dfs((api_str, providers), visited, stack)
+    # iterative post-order DFS; each frame is (api_str, iterator over its deps)
+    for api_str in providers_with_specs:
+        if api_str in visited:
+            continue
+
+        visited.add(api_str)
+        frames = [(api_str, iter(deps_by_api[api_str]))]
+        while frames:
+            node, deps = frames[-1]
+            for dep in deps:
+                if dep not in visited:
+                    visited.add(dep)
+                    frames.append((dep, iter(deps_by_api[dep])))
+                    break
+            else:
+                frames.pop()
+                stack.append(node)
 
     flattened = []
     for api_str in stack:
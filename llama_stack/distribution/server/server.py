@@ -12,17 +12,15 @@ import signal
 import traceback
 
 from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from ssl import SSLError
 from typing import Any, Dict, Optional
 
-import fire
-import httpx
-import yaml
-
 from fastapi import Body, FastAPI, HTTPException, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, ValidationError
+from starlette.background import BackgroundTask
 from termcolor import cprint
 from typing_extensions import Annotated
 
@@ -38,17 +36,18 @@ from llama_stack.distribution.datatypes import *  # noqa: F403
 
 from llama_stack.distribution.request_headers import set_request_provider_data
 from llama_stack.distribution.resolver import resolve_impls_with_routing
+from llama_stack.distribution.utils.serialize import load_config_cached
 
 from .endpoints import get_all_api_endpoints
 
 
-def create_sse_event(data: Any) -> str:
+def create_sse_event(data: Any) -> bytes:
     if isinstance(data, BaseModel):
-        data = data.json()
+        payload = data.json().encode()
     else:
-        data = json.dumps(data)
+        payload = json.dumps(data).encode()
 
-    return f"data: {data}\n\n"
+    return b"data: " + payload + b"\n\n"
 
 
 async def global_exception_handler(request: Request, exc: Exception):
@@ -93,11 +92,44 @@ def translate_exception(exc: Exception) -> Union[HTTPException, RequestValidatio
         )
 
 
+# shared by all passthrough routes so connections to the downstream server
+# are pooled instead of being set up again for every request
+_HTTP_CLIENT = None
+
+
+def create_http_client(**kwargs):
+    import httpx
+
+    # the client is shared by all callers, so it must not keep cookies set by
+    # the downstream server for one caller and replay them for another
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=256),
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        **kwargs,
+    )
+
+
+def get_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = create_http_client()
+    return _HTTP_CLIENT
+
+
+async def close_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
 async def passthrough(
     request: Request,
     downstream_url: str,
     downstream_headers: Optional[Dict[str, str]] = None,
 ):
+    import httpx
+
     await start_trace(request.path, {"downstream_url": downstream_url})
 
     headers = dict(request.headers)
@@ -106,7 +138,7 @@ async def passthrough(
 
     content = await request.body()
 
-    client = httpx.AsyncClient()
+    client = get_http_client()
     erred = False
     try:
         req = client.build_request(
@@ -118,18 +150,31 @@ async def passthrough(
         )
         response = await client.send(req, stream=True)
 
-        async def stream_response():
-            async for chunk in response.aiter_raw(chunk_size=64):
-                yield chunk
+        # httpx lower-cases header names, so plain dict lookups work below
+        response_headers = dict(response.headers)
+        content_type = response_headers.get("content-type")
 
-            await response.aclose()
-            await client.aclose()
+        # event streams are relayed as they arrive so events are not held back
+        # until a chunk fills up; everything else is copied in large chunks
+        is_sse = (content_type or "").startswith("text/event-stream")
+        chunk_size = None if is_sse else 65536
 
+        async def stream_response():
+            try:
+                async for chunk in response.aiter_raw(chunk_size=chunk_size):
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        # also close from a background task: if the client disconnects before
+        # the first chunk is pulled, the generator's `finally` never runs and
+        # the connection would stay checked out of the shared pool
         return StreamingResponse(
             stream_response(),
             status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.headers.get("content-type"),
+            headers=response_headers,
+            media_type=content_type,
+            background=BackgroundTask(response.aclose),
         )
 
     except httpx.ReadTimeout:
@@ -164,11 +209,16 @@ def handle_sigint(app, *args, **kwargs):
 
     asyncio.run(run_shutdown())
 
+    # don't walk the task list inside the signal handler; let the loop cancel
+    # its tasks and stop on its next iteration
     loop = asyncio.get_event_loop()
-    for task in asyncio.all_tasks(loop):
-        task.cancel()
 
-    loop.stop()
+    def cancel_all_tasks():
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+
+    loop.call_soon_threadsafe(cancel_all_tasks)
+    loop.call_soon_threadsafe(loop.stop)
 
 
 @asynccontextmanager
@@ -205,7 +255,6 @@ async def sse_generator(event_gen):
     try:
         async for item in event_gen:
             yield create_sse_event(item)
-            await asyncio.sleep(0.01)
     except asyncio.CancelledError:
         print("Generator cancelled")
         await event_gen.aclose()
@@ -223,13 +272,18 @@ async def sse_generator(event_gen):
 
 
 def create_dynamic_typed_route(func: Any, method: str):
+    func_name = func.__name__
+    sig = inspect.signature(func)
+    # methods without a `stream` parameter can never stream, so skip the
+    # per-request check for them
+    can_stream = "stream" in sig.parameters
 
     async def endpoint(request: Request, **kwargs):
-        await start_trace(func.__name__)
+        await start_trace(func_name)
 
         set_request_provider_data(request.headers)
 
-        is_streaming = is_streaming_request(func.__name__, request, **kwargs)
+        is_streaming = can_stream and is_streaming_request(func_name, request, **kwargs)
         try:
             if is_streaming:
                 return StreamingResponse(
@@ -244,7 +298,6 @@ def create_dynamic_typed_route(func: Any, method: str):
         finally:
             await end_trace()
 
-    sig = inspect.signature(func)
     new_params = [
         inspect.Parameter(
             "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request
@@ -271,10 +324,12 @@ def main(
     port: int = 5000,
     disable_ipv6: bool = False,
 ):
-    with open(yaml_config, "r") as fp:
-        config = StackRunConfig(**yaml.safe_load(fp))
+    config = StackRunConfig(**load_config_cached(yaml_config))
 
     app = FastAPI()
+    route_decorators = {
+        method: getattr(app, method) for method in ("get", "post", "delete")
+    }
 
     impls = asyncio.run(resolve_impls_with_routing(config))
     if Api.telemetry in impls:
@@ -300,7 +355,7 @@ def main(
         if is_passthrough(impl.__provider_spec__):
             for endpoint in endpoints:
                 url = impl.__provider_config__.url.rstrip("/") + endpoint.route
-                getattr(app, endpoint.method)(endpoint.route)(
+                route_decorators[endpoint.method](endpoint.route)(
                     create_dynamic_passthrough(url)
                 )
         else:
@@ -313,7 +368,7 @@ def main(
 
                 impl_method = getattr(impl, endpoint.name)
 
-                getattr(app, endpoint.method)(endpoint.route, response_model=None)(
+                route_decorators[endpoint.method](endpoint.route, response_model=None)(
                     create_dynamic_typed_route(
                         impl_method,
                         endpoint.method,
@@ -327,6 +382,7 @@ def main(
     print("")
     app.exception_handler(RequestValidationError)(global_exception_handler)
     app.exception_handler(Exception)(global_exception_handler)
+    app.add_event_handler("shutdown", close_http_client)
     signal.signal(signal.SIGINT, functools.partial(handle_sigint, app))
 
     app.__llama_stack_impls__ = impls
@@ -340,4 +396,6 @@ def main(
 
 
 if __name__ == "__main__":
+    import fire
+
     fire.Fire(main)
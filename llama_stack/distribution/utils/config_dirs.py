@@ -19,3 +19,5 @@ DEFAULT_CHECKPOINT_DIR = LLAMA_STACK_CONFIG_DIR / "checkpoints"
 BUILDS_BASE_DIR = LLAMA_STACK_CONFIG_DIR / "builds"
 
 RUNTIME_BASE_DIR = LLAMA_STACK_CONFIG_DIR / "runtime"
+
+CACHE_BASE_DIR = LLAMA_STACK_CONFIG_DIR / "cache"
@@ -4,9 +4,25 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+import copy
+import hashlib
 import json
+import os
+import tempfile
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+from llama_stack.distribution.utils.config_dirs import CACHE_BASE_DIR
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
 
 class EnumEncoder(json.JSONEncoder):
@@ -16,3 +32,99 @@ class EnumEncoder(json.JSONEncoder):
         elif isinstance(obj, datetime):
             return obj.isoformat()
         return super().default(obj)
+
+
+class EnumDumper(SafeDumper):
+    """
+    YAML counterpart of EnumEncoder: writes enums as their values and datetimes
+    as ISO strings, so `model.dict()` can be dumped without a JSON round trip.
+
+    Unlike that round trip, non-string keys keep their YAML type (`{1: "x"}` is
+    written as `1: x`, not `'1': x`) and sets are written as `!!set` instead of
+    raising.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+EnumDumper.add_multi_representer(
+    Enum, lambda dumper, obj: dumper.represent_data(obj.value)
+)
+EnumDumper.add_representer(
+    datetime, lambda dumper, obj: dumper.represent_str(obj.isoformat())
+)
+
+
+class _ConfigChangedError(Exception):
+    pass
+
+
+def load_config_cached(path: Union[str, Path]) -> Any:
+    """
+    Loads a YAML config file. The parsed contents are also cached as JSON under
+    CACHE_BASE_DIR, keyed by the file's resolved path, and that cache is used as
+    long as the file's mtime and size are unchanged. Within a process, results
+    are memoized on the same key.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    try:
+        config_dict = _load_config(path, stat.st_mtime_ns, stat.st_size)
+    except _ConfigChangedError:
+        # the file is being rewritten; don't cache what we read
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=SafeLoader)
+
+    # callers are free to mutate what they get back, so hand out copies
+    return copy.deepcopy(config_dict)
+
+
+@lru_cache(maxsize=32)
+def _load_config(path: Path, mtime_ns: int, size: int) -> Any:
+    source = {
+        "path": str(path),
+        "mtime_ns": mtime_ns,
+        "size": size,
+    }
+    cache_path = (
+        CACHE_BASE_DIR / f"{hashlib.sha256(str(path).encode()).hexdigest()}.json"
+    )
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get("source") == source:
+            return cached["config"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(path, "rb") as f:
+        config_dict = yaml.load(f, Loader=SafeLoader)
+
+    stat = path.stat()
+    if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+        raise _ConfigChangedError()
+
+    # the JSON cache is only an optimization: skip it if JSON would not give
+    # back exactly the same value (e.g. non-string keys, datetimes) or if the
+    # cache dir is not writable
+    try:
+        if json.loads(json.dumps(config_dict)) != config_dict:
+            return config_dict
+    except (TypeError, ValueError):
+        return config_dict
+
+    tmp_path = None
+    try:
+        CACHE_BASE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=CACHE_BASE_DIR, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump({"source": source, "config": config_dict}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    return config_dict
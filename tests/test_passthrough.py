@@ -0,0 +1,38 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+
+# Run this test using the following command:
+# python -m unittest tests/test_passthrough.py
+
+import unittest
+
+import httpx
+
+from llama_stack.distribution.server.server import create_http_client
+
+
+class PassthroughClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_downstream_cookies_are_not_shared_between_requests(self):
+        seen_cookies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_cookies.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=caller-1"})
+
+        async with create_http_client(transport=httpx.MockTransport(handler)) as client:
+            await client.get("http://downstream.local/models/list")
+            await client.get("http://downstream.local/models/list")
+            await client.get(
+                "http://downstream.local/models/list",
+                headers={"cookie": "session=caller-3"},
+            )
+
+        self.assertEqual(seen_cookies, [None, None, "session=caller-3"])
+        self.assertEqual(len(client.cookies.jar), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
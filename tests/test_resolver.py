@@ -0,0 +1,96 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+
+# Run this test using the following command:
+# python -m unittest tests/test_resolver.py
+
+import unittest
+from types import SimpleNamespace
+
+from llama_stack.distribution.resolver import topological_sort
+
+
+def provider(provider_id, *deps):
+    return SimpleNamespace(
+        provider_id=provider_id, spec=SimpleNamespace(deps__=list(deps))
+    )
+
+
+def sorted_ids(providers_with_specs):
+    return [
+        (api_str, p.provider_id)
+        for api_str, p in topological_sort(providers_with_specs)
+    ]
+
+
+class TopologicalSortTests(unittest.TestCase):
+    def test_chain(self):
+        self.assertEqual(
+            sorted_ids(
+                {
+                    "agents": [provider("a", "memory")],
+                    "memory": [provider("m", "inference")],
+                    "inference": [provider("i")],
+                }
+            ),
+            [("inference", "i"), ("memory", "m"), ("agents", "a")],
+        )
+
+    def test_diamond(self):
+        self.assertEqual(
+            sorted_ids(
+                {
+                    "top": [provider("t", "left", "right")],
+                    "left": [provider("l", "bottom")],
+                    "right": [provider("r", "bottom")],
+                    "bottom": [provider("b")],
+                }
+            ),
+            [("bottom", "b"), ("left", "l"), ("right", "r"), ("top", "t")],
+        )
+
+    def test_cycle(self):
+        self.assertEqual(
+            sorted_ids(
+                {
+                    "x": [provider("x", "y")],
+                    "y": [provider("y", "z")],
+                    "z": [provider("z", "x")],
+                }
+            ),
+            [("z", "z"), ("y", "y"), ("x", "x")],
+        )
+
+    def test_several_providers_per_api(self):
+        self.assertEqual(
+            sorted_ids(
+                {
+                    "agents": [
+                        provider("a1", "inference"),
+                        provider("a2", "inference", "safety"),
+                    ],
+                    "inference": [provider("i1"), provider("i2", "memory")],
+                    "safety": [provider("s1", "inference")],
+                    "memory": [provider("m1")],
+                }
+            ),
+            [
+                ("memory", "m1"),
+                ("inference", "i1"),
+                ("inference", "i2"),
+                ("safety", "s1"),
+                ("agents", "a1"),
+                ("agents", "a2"),
+            ],
+        )
+
+    def test_missing_dependency_raises(self):
+        with self.assertRaises(KeyError):
+            topological_sort({"agents": [provider("a", "memory")]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+
+# Run this test using the following command:
+# python -m unittest tests/test_serialize.py
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from llama_stack.distribution.utils import serialize
+from llama_stack.distribution.utils.serialize import (
+    EnumDumper,
+    EnumEncoder,
+    load_config_cached,
+)
+
+
+def write_config(path, text, mtime_ns):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class LoadConfigCachedTests(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name).resolve()
+        self.cache_dir = self.tmp_path / "cache"
+
+        patcher = mock.patch.object(serialize, "CACHE_BASE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.config_dir = self.tmp_path / "configs"
+        self.config_dir.mkdir()
+        self.config = self.config_dir / "run.yaml"
+
+    def cache_files(self):
+        return sorted(self.cache_dir.glob("*.json"))
+
+    def test_cache_is_written_under_cache_dir(self):
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+
+        self.assertEqual(load_config_cached(self.config), {"name": "foo"})
+        self.assertEqual(os.listdir(self.config_dir), ["run.yaml"])
+
+        (cache_file,) = self.cache_files()
+        self.assertEqual(
+            json.loads(cache_file.read_text()),
+            {
+                "source": {
+                    "path": str(self.config),
+                    "mtime_ns": 1_000_000_000,
+                    "size": len("name: foo\n"),
+                },
+                "config": {"name": "foo"},
+            },
+        )
+
+    def test_cache_is_keyed_by_path(self):
+        other = self.tmp_path / "run.yaml"
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+        write_config(other, "name: foo\n", 1_000_000_000)
+
+        load_config_cached(self.config)
+        load_config_cached(other)
+        self.assertEqual(len(self.cache_files()), 2)
+
+    def test_matching_cache_is_used(self):
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+        load_config_cached(self.config)
+
+        (cache_file,) = self.cache_files()
+        payload = json.loads(cache_file.read_text())
+        payload["source"]["mtime_ns"] = 2_000_000_000
+        payload["config"] = {"name": "from-cache"}
+        cache_file.write_text(json.dumps(payload))
+
+        os.utime(self.config, ns=(2_000_000_000, 2_000_000_000))
+        self.assertEqual(load_config_cached(self.config), {"name": "from-cache"})
+
+    def test_cache_is_invalidated_on_mtime_or_size_change(self):
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+        self.assertEqual(load_config_cached(self.config), {"name": "foo"})
+
+        # same size, different mtime
+        write_config(self.config, "name: bar\n", 2_000_000_000)
+        self.assertEqual(load_config_cached(self.config), {"name": "bar"})
+
+        # same mtime, different size
+        write_config(self.config, "name: bazz\n", 2_000_000_000)
+        self.assertEqual(load_config_cached(self.config), {"name": "bazz"})
+
+        # an older file restored over a newer cache entry
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+        self.assertEqual(load_config_cached(self.config), {"name": "foo"})
+
+    def test_foreign_cache_file_is_ignored(self):
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+        load_config_cached(self.config)
+        (cache_file,) = self.cache_files()
+
+        foreign = [
+            "not json",
+            '["a", "list"]',
+            '{"config": {"shadow": 1}}',
+            '{"source": {"path": "/elsewhere", "mtime_ns": 2000000000, "size": 10}, '
+            '"config": {"shadow": 1}}',
+        ]
+        for i, contents in enumerate(foreign):
+            with self.subTest(contents=contents):
+                mtime_ns = (i + 2) * 1_000_000_000
+                os.utime(self.config, ns=(mtime_ns, mtime_ns))
+                cache_file.write_text(contents)
+                self.assertEqual(load_config_cached(self.config), {"name": "foo"})
+
+    def test_unwritable_cache_dir(self):
+        blocker = self.tmp_path / "blocker"
+        blocker.write_text("")
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+
+        with mock.patch.object(serialize, "CACHE_BASE_DIR", blocker / "cache"):
+            self.assertEqual(load_config_cached(self.config), {"name": "foo"})
+        self.assertEqual(os.listdir(self.config_dir), ["run.yaml"])
+
+    def test_values_json_cannot_represent_are_not_cached(self):
+        write_config(
+            self.config, "1: x\nbuilt_at: 2024-10-08 17:40:45\n", 1_000_000_000
+        )
+
+        expected = {1: "x", "built_at": datetime(2024, 10, 8, 17, 40, 45)}
+        self.assertEqual(load_config_cached(self.config), expected)
+        self.assertEqual(load_config_cached(self.config), expected)
+        self.assertEqual(self.cache_files(), [])
+
+    def test_callers_get_independent_copies(self):
+        write_config(self.config, "providers:\n  inference: []\n", 1_000_000_000)
+
+        first = load_config_cached(self.config)
+        first["providers"]["inference"].append("mutated")
+        first["version"] = "2"
+
+        self.assertEqual(
+            load_config_cached(self.config), {"providers": {"inference": []}}
+        )
+
+    def test_config_changed_while_reading_is_not_cached(self):
+        write_config(self.config, "name: foo\n", 1_000_000_000)
+        yaml_load = serialize.yaml.load
+
+        def load_and_rewrite(stream, Loader):
+            result = yaml_load(stream, Loader=Loader)
+            if result == {"name": "foo"}:
+                write_config(self.config, "name: barr\n", 2_000_000_000)
+            return result
+
+        with mock.patch.object(serialize.yaml, "load", load_and_rewrite):
+            self.assertEqual(load_config_cached(self.config), {"name": "barr"})
+        self.assertEqual(self.cache_files(), [])
+
+        # what was read before the rewrite must not have been kept for the
+        # original mtime and size either
+        write_config(self.config, "name: oof\n", 1_000_000_000)
+        self.assertEqual(load_config_cached(self.config), {"name": "oof"})
+
+
+class Color(Enum):
+    red = "red"
+
+
+class ImageType(str, Enum):
+    conda = "conda"
+
+
+class EnumDumperTests(unittest.TestCase):
+    def dump(self, data):
+        return yaml.dump(data, Dumper=EnumDumper, sort_keys=False)
+
+    def test_matches_json_round_trip(self):
+        shared = {"url": "http://localhost:5000", "ports": [1, 2]}
+        data = {
+            "built_at": datetime(2024, 10, 8, 17, 40, 45, 123456),
+            "image_type": ImageType.conda,
+            "apis": [Color.red, "safety"],
+            "providers": {
+                "inference": [
+                    {"provider_id": "a", "config": shared},
+                    {"provider_id": "b", "config": shared},
+                ],
+            },
+            "disabled": None,
+            "ratio": 1.5,
+            "enabled": True,
+        }
+
+        dumped = self.dump(data)
+        self.assertEqual(
+            dumped,
+            yaml.dump(json.loads(json.dumps(data, cls=EnumEncoder)), sort_keys=False),
+        )
+        self.assertNotIn("&id", dumped)
+        self.assertNotIn("*id", dumped)
+        self.assertEqual(
+            yaml.safe_load(dumped)["built_at"], "2024-10-08T17:40:45.123456"
+        )
+        self.assertEqual(yaml.safe_load(dumped)["image_type"], "conda")
+
+    def test_non_string_keys_and_sets_keep_their_type(self):
+        self.assertEqual(self.dump({"config": {1: "x"}}), "config:\n  1: x\n")
+        self.assertEqual(yaml.safe_load(self.dump({"tags": {"a"}})), {"tags": {"a"}})
+
+
+if __name__ == "__main__":
+    unittest.main()